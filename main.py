@@ -23,30 +23,44 @@ Sound assets:
 Author: Chase Choi
 """
 
+import concurrent.futures
+import math
 import os
 import sys
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-# Optional: pygame for sound
+# Mixer chunk size in samples. Smaller = lower SFX latency (512 @ 44.1 kHz ~ 12 ms).
+# Slow hardware that crackles can bump it via the SFX_BUFFER env var (e.g. 2048).
+try:
+  SFX_BUFFER = int(os.environ.get("SFX_BUFFER", "512"))
+except ValueError:
+  SFX_BUFFER = 512
+
+# Volume applied to every SFX Sound once at load time
+SFX_VOLUME = 0.7
+
+# Optional: pygame for sound (the mixer itself is opened lazily by Sounder)
 try:
   import pygame
-  pygame.mixer.pre_init(44100, -16, 2, 1024)
-  pygame.mixer.init()
-  pygame.mixer.music.set_volume(0.5)
-  SOUND_OK = True
 except Exception:
-  SOUND_OK = False
+  pygame = None
 
 APP_TITLE = "Chain Reaction — Final Round"
 
+# Max interval (ms) between timer polls while it runs (~60 Hz), so the display
+# follows the deadline closely instead of waiting on a 1 s after() chain.
+MAX_FRAMERATE_MS = 16
+
 # ---- CONFIG ----
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 SOUND_FILES = {
   "correct": os.path.join(ASSETS_DIR, "correct.wav"),
   "wrong": os.path.join(ASSETS_DIR, "incorrect.wav"),
   "tick": os.path.join(ASSETS_DIR, "tick.wav"),  # optional letter-reveal sound
-  # Background soundtrack for timer (looped while timer runs)
+  # Background soundtrack for timer (looped while timer runs). Streamed via
+  # pygame.mixer.music; a theme.ogg next to it is preferred (smaller, faster to open).
   "soundtrack": os.path.join(ASSETS_DIR, "theme.wav"),
   "last_letter": os.path.join(ASSETS_DIR, "ding.wav"),
 }
@@ -67,15 +81,55 @@ SAMPLE_CHAIN = [
 # ---- SOUND HELPERS ----
 class Sounder:
   def __init__(self):
-    self.enabled = SOUND_OK
+    # Opening the audio device can stall on some backends, so it happens here
+    # (after the windows exist) rather than at import; failure just means silence.
+    self.enabled = False
+    if pygame is not None:
+      try:
+        pygame.mixer.pre_init(44100, -16, 2, SFX_BUFFER)
+        pygame.mixer.init()
+        pygame.mixer.music.set_volume(0.5)
+        self.enabled = True
+      except Exception:
+        pass
     self.cache = {}
+    self.channels = {}
+    self.music_loaded = False
+    self._music_state = "stopped"  # "stopped" | "playing" | "paused"
+    self._asset_names: set[str] = set()
+    # Single worker so SDL play() calls never stall the Tk thread (and stay in order)
+    self._sfx_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1) if self.enabled else None
     if self.enabled:
-      for key, path in SOUND_FILES.items():
-        if path and os.path.exists(path):
+      # One directory read instead of a stat() per sound file
+      try:
+        self._asset_names = {e.name for e in os.scandir(ASSETS_DIR)}
+      except OSError:
+        self._asset_names = set()
+      # The soundtrack is streamed by mixer.music, not decoded into a Sound
+      present = {
+        key: path for key, path in SOUND_FILES.items()
+        if key != "soundtrack" and path and self._exists(path)
+      }
+      # Decoding happens in C without the GIL, so load all files concurrently
+      if present:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(present)) as ex:
+          futures = {key: ex.submit(pygame.mixer.Sound, path) for key, path in present.items()}
+        for key, fut in futures.items():
           try:
-            self.cache[key] = pygame.mixer.Sound(path)
+            snd = fut.result()
+            snd.set_volume(SFX_VOLUME)  # set once here, not per play
+            self.cache[key] = snd
           except Exception:
             pass
+      # One dedicated channel per cue so a replay cuts off its own previous
+      # play instead of waiting on SDL to hand out a free channel.
+      try:
+        pygame.mixer.set_num_channels(len(SOUND_FILES) + 2)
+        self.channels = {key: pygame.mixer.Channel(i) for i, key in enumerate(self.cache)}
+      except Exception:
+        self.channels = {}
+      # Open the soundtrack once so Start doesn't pay for a file read + decoder setup
+      self._load_music()
 
   def play(self, key: str):
     if not self.enabled:
@@ -83,9 +137,80 @@ class Sounder:
     s = self.cache.get(key)
     if s is not None:
       try:
+        self._sfx_executor.submit(self._play_now, key, s)
+      except RuntimeError:
+        pass  # executor already shut down (app closing)
+
+  def _play_now(self, key: str, s):
+    try:
+      ch = self.channels.get(key)
+      if ch is not None:
+        ch.play(s)
+      else:
         s.play()
-      except Exception:
-        pass
+    except Exception:
+      pass
+
+  def _exists(self, path: str) -> bool:
+    # A hit in the startup scan of ASSETS_DIR skips the stat(). Anything else,
+    # including a case mismatch on case-insensitive filesystems (Windows/macOS),
+    # still goes to os.path.exists so no sound silently goes missing.
+    if os.path.dirname(path) == ASSETS_DIR and os.path.basename(path) in self._asset_names:
+      return True
+    return os.path.exists(path)
+
+  def _load_music(self):
+    path = SOUND_FILES.get("soundtrack")
+    if not path:
+      return
+    ogg = os.path.splitext(path)[0] + ".ogg"
+    for candidate in (ogg, path):
+      if self._exists(candidate):
+        try:
+          pygame.mixer.music.load(candidate)
+          self.music_loaded = True
+          return
+        except Exception:
+          pass
+
+  # NOTE: don't drive any UI from pygame.mixer.music.get_pos() — its reported
+  # position lags further behind the longer the stream plays. For elapsed/remaining
+  # time use time.monotonic() against the timer deadline (App._deadline) instead.
+  def start_music(self):
+    if not (self.enabled and self.music_loaded):
+      return
+    try:
+      if self._music_state == "paused":
+        pygame.mixer.music.unpause()
+      elif self._music_state == "stopped":
+        pygame.mixer.music.play(-1)  # loop
+      self._music_state = "playing"
+    except Exception:
+      pass
+
+  def pause_music(self):
+    if not (self.enabled and self.music_loaded) or self._music_state != "playing":
+      return
+    try:
+      pygame.mixer.music.pause()
+      self._music_state = "paused"
+    except Exception:
+      pass
+
+  def stop_music(self):
+    if not (self.enabled and self.music_loaded):
+      return
+    try:
+      pygame.mixer.music.stop()
+      self._music_state = "stopped"
+    except Exception:
+      pass
+
+  def close(self):
+    self.enabled = False
+    if self._sfx_executor is not None:
+      self._sfx_executor.shutdown(wait=False, cancel_futures=True)
+      self._sfx_executor = None
 
 
 # ---- GAME STATE ----
@@ -93,16 +218,24 @@ class GameState:
   def __init__(self, words: list[str]):
     if len(words) < 3:
       raise ValueError("Chain must have at least 3 words (top, middle..., bottom)")
-    self.words = [w.strip().upper() for w in words]
-    # first and last fully revealed; middle hidden
-    self.revealed = []
+    self.words = tuple(w.strip().upper() for w in words)
+    # first and last fully revealed; middle hidden. One byte (0/1) per letter.
+    self.revealed: list[bytearray] = []
     for i, w in enumerate(self.words):
       if i in (0, len(self.words) - 1):
-        self.revealed.append([True] * len(w))
+        self.revealed.append(bytearray(b"\x01" * len(w)))
       else:
-        self.revealed.append([False] * len(w))
+        self.revealed.append(bytearray(len(w)))
     # Track when the final letter is intentionally withheld for a word
     self.withheld_last = [False] * len(self.words)
+    # Per word: leftmost hidden position (len(w) when none) and how many are still hidden
+    self.next_hidden = [flags.find(0) if 0 in flags else len(flags) for flags in self.revealed]
+    self.hidden_count = [flags.count(0) for flags in self.revealed]
+    # word_mask()/spaced_mask() results; entries are reset to None whenever that word changes
+    self._mask_cache: list[str | None] = [None] * len(self.words)
+    self._spaced_cache: list[str | None] = [None] * len(self.words)
+    # Middle indices not yet fully revealed (kept in sync by the reveal methods)
+    self.unsolved = {i for i in range(1, len(self.words) - 1) if not self.is_word_complete(i)}
 
   def word_mask(self, idx: int) -> str:
     """
@@ -112,6 +245,25 @@ class GameState:
       - If the last letter was withheld, append a question mark at the end.
     This prevents revealing the total length of the word.
     """
+    cached = self._mask_cache[idx]
+    if cached is not None:
+      return cached
+    self._mask_cache[idx] = s = self._build_mask(idx)
+    return s
+
+  def spaced_mask(self, idx: int) -> str:
+    """word_mask() with spaces between shown letters, as painted on the display."""
+    cached = self._spaced_cache[idx]
+    if cached is not None:
+      return cached
+    self._spaced_cache[idx] = s = " ".join(self.word_mask(idx))
+    return s
+
+  def _invalidate(self, idx: int):
+    self._mask_cache[idx] = None
+    self._spaced_cache[idx] = None
+
+  def _build_mask(self, idx: int) -> str:
     w = self.words[idx]
     flags = self.revealed[idx]
     if idx in (0, len(self.words) - 1):
@@ -121,7 +273,7 @@ class GameState:
     shown_letters = [ch for ch, f in zip(w, flags) if f]
     s = "".join(shown_letters)
     # If we deliberately withheld the final letter (all but one revealed), show a question mark
-    if self.withheld_last[idx] and not all(flags):
+    if self.withheld_last[idx] and 0 in flags:
       if s:
         return s + " ?"
       else:
@@ -136,38 +288,52 @@ class GameState:
     """
     if idx in (0, len(self.words) - 1):
       return (False, False)
-    flags = self.revealed[idx]
-    hidden_positions = [i for i, f in enumerate(flags) if not f]
-    if not hidden_positions:
+    count = self.hidden_count[idx]
+    if count == 0:
       return (False, False)
-    if len(hidden_positions) == 1:
+    if count == 1:
       # Do NOT reveal the last letter; mark withheld and signal to UI
       self.withheld_last[idx] = True
+      self._invalidate(idx)
       return (False, True)
-    # Otherwise reveal the next leftmost hidden letter
-    next_i = hidden_positions[0]
-    flags[next_i] = True
+    # Otherwise reveal the next leftmost hidden letter (at least one stays hidden)
+    flags = self.revealed[idx]
+    next_i = self.next_hidden[idx]
+    flags[next_i] = 1
+    self.hidden_count[idx] = count - 1
+    next_i += 1
+    while flags[next_i]:
+      next_i += 1
+    self.next_hidden[idx] = next_i
+    self._invalidate(idx)
     return (True, False)
 
   def is_word_complete(self, idx: int) -> bool:
-    return all(self.revealed[idx])
+    return 0 not in self.revealed[idx]
 
   def try_guess(self, idx: int, guess: str) -> bool:
     """If guess matches, reveal whole word. Returns True if correct."""
-    target = self.words[idx]
-    if guess.strip().upper() == target:
-      self.revealed[idx] = [True] * len(target)
-      self.withheld_last[idx] = False
+    if guess.strip().upper() == self.words[idx]:
+      self.reveal_word(idx)
       return True
     return False
 
+  def reveal_word(self, idx: int):
+    """Reveal every letter of a word (clears any withheld-last marker)."""
+    self.revealed[idx] = bytearray(b"\x01" * len(self.words[idx]))
+    self.next_hidden[idx] = len(self.words[idx])
+    self.hidden_count[idx] = 0
+    self.withheld_last[idx] = False
+    self._invalidate(idx)
+    self.unsolved.discard(idx)
+
 
 # ---- UI ----
 class App:
   def __init__(self, root: tk.Tk):
     self.root = root
     self.root.title(APP_TITLE)
-    self.sounder = Sounder()
+    self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # Create display window (for screen share)
     self.display = tk.Toplevel(self.root)
@@ -212,13 +378,30 @@ class App:
     # ---- Timer state (ensure these exist BEFORE any refresh_display call) ----
     self.timer_running = False
     self.timer_seconds = 60  # default
-    self._timer_job = None
+    # Bumped on every start/pause/reset; a scheduled tick from an older
+    # generation is stale and returns immediately (no after_cancel needed).
+    self._timer_gen = 0
+    self._deadline = 0.0  # time.monotonic() at which the running timer hits zero
+
+    # Coalesced repaint after reveal clicks (see _schedule_refresh)
+    self._pending_refresh = None
+    self._pending_highlight: int | None = None
 
     # Initialize with sample chain
     self.game: GameState | None = None
     self.labels: list[tk.Label] = []
+    self.label_vars: list[tk.StringVar] = []  # text of each label (a plain Tcl set to update)
+    self._label_rows: list[tk.Frame] = []
+    # Last text/fg pushed to each label, so refresh_display can skip no-op configs
+    self._last_text: list[str] = []
+    self._last_fg: list[str] = []
+    self._visible_rows = 0
     self.load_chain_from_text("\n".join(SAMPLE_CHAIN))
 
+    # Map both windows before opening the mixer so a slow audio init doesn't hold them up
+    self.root.update_idletasks()
+    self.sounder = Sounder()
+
   # ---- Host controls ----
   def _build_host_controls(self, parent: tk.Widget):
     parent.geometry("600x780")
@@ -262,6 +445,9 @@ class App:
     tk.Label(guess_row, text="Guess:").grid(row=0, column=0, sticky="w")
     self.guess_entry = tk.Entry(guess_row, width=30)
     self.guess_entry.grid(row=0, column=1, padx=6)
+    # Enter submits, Escape clears — no trip to the mouse between guesses
+    self.guess_entry.bind("<Return>", lambda e: self._on_submit_guess())
+    self.guess_entry.bind("<Escape>", lambda e: self.guess_entry.delete(0, tk.END))
     tk.Button(guess_row, text="Submit Guess", command=self._on_submit_guess).grid(row=0, column=2, padx=4)
 
     sound_row = tk.Frame(parent)
@@ -286,6 +472,10 @@ class App:
     tk.Label(status, textvariable=self.status_var).pack(anchor="w")
 
   # ---- Event handlers ----
+  def _on_close(self):
+    self.sounder.close()
+    self.root.destroy()
+
   def _on_toggle_fullscreen(self):
     cur = bool(self.display.attributes("-fullscreen"))
     self.display.attributes("-fullscreen", not cur)
@@ -315,12 +505,12 @@ class App:
       return
     revealed, withheld = self.game.reveal_next_letter(idx)
     if revealed:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("tick")
       self.status_var.set(f"Gave a letter to word {idx}.")
       self._maybe_puzzle_solved()
     elif withheld:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("last_letter")
       self.status_var.set("Last letter withheld — ? shown.")
       self._maybe_puzzle_solved()
@@ -337,12 +527,12 @@ class App:
       return
     revealed, withheld = self.game.reveal_next_letter(idx)
     if revealed:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("tick")
       self.status_var.set(f"Gave a letter (above) to word {idx}.")
       self._maybe_puzzle_solved()
     elif withheld:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("tick")
       self.status_var.set("Last letter withheld — ? shown (above).")
       self._maybe_puzzle_solved()
@@ -359,12 +549,12 @@ class App:
       return
     revealed, withheld = self.game.reveal_next_letter(idx)
     if revealed:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("tick")
       self.status_var.set(f"Gave a letter (below) to word {idx}.")
       self._maybe_puzzle_solved()
     elif withheld:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("tick")
       self.status_var.set("Last letter withheld — ? shown (below).")
       self._maybe_puzzle_solved()
@@ -378,12 +568,8 @@ class App:
     if idx is None:
       self.status_var.set("No unsolved middle words.")
       return
-    self.game.revealed[idx] = [True] * len(self.game.words[idx])
-    try:
-      self.game.withheld_last[idx] = False
-    except Exception:
-      pass
-    self.refresh_display(highlight_idx=idx)
+    self.game.reveal_word(idx)
+    self._schedule_refresh(highlight_idx=idx)
     self.sounder.play("correct")
     self.status_var.set(f"Revealed (above) word {idx}.")
     self._maybe_puzzle_solved()
@@ -395,12 +581,8 @@ class App:
     if idx is None:
       self.status_var.set("No unsolved middle words.")
       return
-    self.game.revealed[idx] = [True] * len(self.game.words[idx])
-    try:
-      self.game.withheld_last[idx] = False
-    except Exception:
-      pass
-    self.refresh_display(highlight_idx=idx)
+    self.game.reveal_word(idx)
+    self._schedule_refresh(highlight_idx=idx)
     self.sounder.play("correct")
     self.status_var.set(f"Revealed (below) word {idx}.")
     self._maybe_puzzle_solved()
@@ -419,7 +601,7 @@ class App:
       return
     ok = self.game.try_guess(idx, guess)
     if ok:
-      self.refresh_display(highlight_idx=idx)
+      self._schedule_refresh(highlight_idx=idx)
       self.sounder.play("correct")
       self.status_var.set(f"Correct! {self.game.words[idx]}")
       self._maybe_puzzle_solved()
@@ -432,19 +614,13 @@ class App:
     """Return the smallest index of an unsolved middle word (1..n-2), or None."""
     if not self.game:
       return None
-    for i in range(1, len(self.game.words) - 1):
-      if not self.game.is_word_complete(i):
-        return i
-    return None
+    return min(self.game.unsolved, default=None)
 
   def _bottommost_unsolved_idx(self):
     """Return the largest index of an unsolved middle word (n-2..1), or None."""
     if not self.game:
       return None
-    for i in range(len(self.game.words) - 2, 0, -1):
-      if not self.game.is_word_complete(i):
-        return i
-    return None
+    return max(self.game.unsolved, default=None)
 
   def _safe_idx(self):
     try:
@@ -472,44 +648,70 @@ class App:
     self.refresh_display()
 
   def build_display_labels(self):
-    for w in self.chain_frame.winfo_children():
-      w.destroy()
-    self.labels = []
-    if not self.game:
-      return
-
-    for i, _ in enumerate(self.game.words):
+    """Size the label pool to the current chain. Rows are reused across loads and
+    surplus ones are only unpacked, so reloading a chain doesn't churn Tk widgets."""
+    n = len(self.game.words) if self.game else 0
+    rows = self._label_rows
+    # Grow the pool as needed
+    while len(self.labels) < n:
       row = tk.Frame(self.chain_frame, bg="#111111")
-      row.pack(pady=6)
+      sv = tk.StringVar(value="")
       lbl = tk.Label(
         row,
-        text="",
-        fg="#00FFCC" if i in (0, len(self.game.words) - 1) else "#FFFFFF",
+        textvariable=sv,
+        fg="#FFFFFF",
         bg="#111111",
         font=self.font_word,
       )
       lbl.pack()
+      rows.append(row)
       self.labels.append(lbl)
+      self.label_vars.append(sv)
+      self._last_text.append("")
+      self._last_fg.append("#FFFFFF")
+    # Only rows past the shared prefix change visibility (packed rows stay in order)
+    for i in range(self._visible_rows, n):
+      rows[i].pack(pady=6)
+    for i in range(n, self._visible_rows):
+      rows[i].pack_forget()
+    self._visible_rows = n
+
+  def _schedule_refresh(self, highlight_idx: int | None = None):
+    """Repaint shortly after a reveal; a burst of clicks collapses into one refresh.
+    Game state is already updated by the caller — only the paint is deferred."""
+    self._pending_highlight = highlight_idx
+    if self._pending_refresh is not None:
+      return
+    self._pending_refresh = self.root.after(30, self._do_refresh)
+
+  def _do_refresh(self):
+    self._pending_refresh = None
+    self.refresh_display(highlight_idx=self._pending_highlight)
+    # Flush the batch as one paint now (update() would re-enter event handling)
+    self.display.update_idletasks()
 
   def refresh_display(self, highlight_idx: int | None = None):
     if not self.game:
       return
-    for i, lbl in enumerate(self.labels):
-      mask = self.game.word_mask(i)
-      # Insert spaces between shown letters only (no placeholders)
-      pretty = " ".join(list(mask)) if mask else ""
-      lbl.config(text=pretty)
-      if i == 0 or i == len(self.labels) - 1:
-        lbl.config(fg="#00FFCC")
-      else:
-        lbl.config(fg="#FFFFFF")
+    n = self._visible_rows
+    for i in range(n):
+      lbl = self.labels[i]
+      # Spaces between shown letters only (no placeholders)
+      pretty = self.game.spaced_mask(i)
+      if pretty != self._last_text[i]:
+        self.label_vars[i].set(pretty)
+        self._last_text[i] = pretty
+      fg = "#00FFCC" if i == 0 or i == n - 1 else "#FFFFFF"
+      if fg != self._last_fg[i]:
+        lbl.config(fg=fg)
+        self._last_fg[i] = fg
 
     # Update timer label (guard if timer not inited yet)
     secs = getattr(self, "timer_seconds", 0)
     self.timer_label.config(text=self._format_seconds(secs))
 
     if highlight_idx is not None:
-      self.info_label.config(text=f"Selected word: {highlight_idx+1} / {len(self.labels)}")
+      self.info_label.config(text=f"Selected word: {highlight_idx+1} / {n}")
     else:
       self.info_label.config(text="")
 
@@ -522,19 +724,30 @@ class App:
   def _render_timer(self):
     self.timer_label.config(text=self._format_seconds(self.timer_seconds))
 
-  def _update_timer_tick(self):
-    if not self.timer_running:
+  def _schedule_timer_tick(self, remaining: float):
+    # Poll against the deadline rather than a flat 1000 ms, so Tk's after()
+    # jitter doesn't accumulate over a round; never sleep past the next
+    # whole-second boundary.
+    to_boundary = max(1, math.ceil((remaining - math.floor(remaining)) * 1000))
+    gen = self._timer_gen
+    self.root.after(min(MAX_FRAMERATE_MS, to_boundary), lambda: self._update_timer_tick(gen))
+
+  def _update_timer_tick(self, gen: int):
+    if gen != self._timer_gen:
       return
-    self.timer_seconds = max(0, self.timer_seconds - 1)
-    self._render_timer()
-    if self.timer_seconds == 0:
+    remaining = self._deadline - time.monotonic()
+    secs = max(0, math.ceil(remaining))
+    if secs != self.timer_seconds:
+      # Only touch the label when the displayed second actually changes
+      self.timer_seconds = secs
+      self._render_timer()
+    if remaining <= 0:
       # time's up
       self._on_timer_pause()
       self.sounder.play("wrong")
       self.status_var.set("Timer finished.")
       return
-    # schedule next tick
-    self._timer_job = self.root.after(1000, self._update_timer_tick)
+    self._schedule_timer_tick(remaining)
 
   def _on_timer_start(self):
     try:
@@ -545,19 +758,16 @@ class App:
       pass
     if not self.timer_running:
       self.timer_running = True
+      self._timer_gen += 1
       self._render_timer()
       self._start_music()
-      self._timer_job = self.root.after(1000, self._update_timer_tick)
+      self._deadline = time.monotonic() + self.timer_seconds
+      self._schedule_timer_tick(self.timer_seconds)
       self.status_var.set("Timer started.")
 
   def _on_timer_pause(self):
     self.timer_running = False
-    if self._timer_job is not None:
-      try:
-        self.root.after_cancel(self._timer_job)
-      except Exception:
-        pass
-      self._timer_job = None
+    self._timer_gen += 1
     self._pause_music()
     self.status_var.set("Timer paused.")
 
@@ -568,52 +778,25 @@ class App:
     except Exception:
       self.timer_seconds = 60
     self.timer_running = False
-    if self._timer_job is not None:
-      try:
-        self.root.after_cancel(self._timer_job)
-      except Exception:
-        pass
-      self._timer_job = None
+    self._timer_gen += 1
     self._stop_music()
     self._render_timer()
     self.status_var.set("Timer reset.")
 
   def _start_music(self):
-    if not SOUND_OK:
-      return
-    path = SOUND_FILES.get("soundtrack")
-    if not (path and os.path.exists(path)):
-      return
-    try:
-      pygame.mixer.music.load(path)
-      pygame.mixer.music.play(-1)  # loop
-    except Exception:
-      pass
+    self.sounder.start_music()
 
   def _pause_music(self):
-    if not SOUND_OK:
-      return
-    try:
-      pygame.mixer.music.pause()
-    except Exception:
-      pass
+    self.sounder.pause_music()
 
   def _stop_music(self):
-    if not SOUND_OK:
-      return
-    try:
-      pygame.mixer.music.stop()
-    except Exception:
-      pass
+    self.sounder.stop_music()
 
   def _is_puzzle_solved(self) -> bool:
     if not self.game:
       return False
     # all middle words complete
-    for i in range(1, len(self.game.words) - 1):
-      if not self.game.is_word_complete(i):
-        return False
-    return True
+    return not self.game.unsolved
 
   def _maybe_puzzle_solved(self):
     if self._is_puzzle_solved():
@@ -5,12 +5,24 @@
 # - Finale shows a banner BELOW the timer (no overlap) and flashes cards lightly.
 # - Host can pre-type all 6; only the current "Correct" button is enabled.
 
+import array
+import math
+import queue
 import threading
 import time
 import tkinter as tk
 from tkinter import ttk
 from dataclasses import dataclass, field
 
+# Low-latency backend: earcons synthesized with numpy and pre-rendered once into
+# pygame Sounds (both are in requirements.txt). HAS_SYNTH needs both importable.
+try:
+  import numpy as np
+  import pygame
+  HAS_SYNTH = True
+except Exception:
+  HAS_SYNTH = False
+
 # Optional Windows sound backend
 try:
   import winsound  # Windows only
@@ -18,55 +30,114 @@ try:
 except Exception:
   HAS_WINSOUND = False
 
-
-def play_correct_sound():
-  if HAS_WINSOUND:
-    try:
-      winsound.Beep(880, 100)
-      winsound.Beep(1175, 140)
-      return
-    except Exception:
-      pass
-  root = tk._default_root
-  if root:
-    root.bell()
-
-
-def play_win_sound():
-  if HAS_WINSOUND:
-    try:
-      for f, d in [(700, 120), (900, 120), (1150, 180), (1400, 220)]:
-        winsound.Beep(f, d)
-        time.sleep(0.05)
-      return
-    except Exception:
-      pass
-  root = tk._default_root
-  if root:
-    for _ in range(3):
-      root.bell()
-      time.sleep(0.15)
+# Filled in by init_sfx(); None means fall back to winsound / bell
+sfx_correct = None
+sfx_win = None
+
+WIN_TONES = [(700, 120), (900, 120), (1150, 180), (1400, 220)]  # (Hz, ms)
+WIN_GAP_MS = 50  # silence between win tones
+
+
+def make_tone(freq, dur_ms, sr=44100):
+  """Sine tone as int16 PCM with a short linear attack/release (no clicks).
+  Built with whole-array NumPy ops; runs once at startup."""
+  n = int(sr * dur_ms / 1000)
+  t = np.arange(n) / sr
+  wave = np.sin(2 * np.pi * freq * t)
+  env = np.ones(n)
+  a = min(n, int(0.005 * sr))  # 5 ms attack
+  r = min(n - a, int(0.02 * sr))  # 20 ms release
+  env[:a] = np.linspace(0, 1, a)
+  if r:
+    env[-r:] = np.linspace(1, 0, r)
+  return (wave * env * 0.5 * 32767).astype(np.int16)
+
+
+def silence(ms, sr=44100):
+  return np.zeros(int(sr * ms / 1000), np.int16)
+
+
+def _to_sound(buf):
+  # Match the mixer's channel count (pre_init asks for mono but SDL may refuse)
+  channels = pygame.mixer.get_init()[2]
+  if channels > 1:
+    buf = np.repeat(buf[:, None], channels, axis=1)
+  return pygame.mixer.Sound(buffer=np.ascontiguousarray(buf).tobytes())
+
+
+def init_sfx():
+  """Open the mixer and synthesize the earcons once, so each cue is a
+  non-blocking Sound.play() instead of a chain of winsound.Beep calls."""
+  global sfx_correct, sfx_win
+  if not HAS_SYNTH:
+    return
+  try:
+    pygame.mixer.pre_init(44100, -16, 1, 512)
+    pygame.mixer.init()
+    sr = pygame.mixer.get_init()[0]
+    sfx_correct = _to_sound(np.concatenate([make_tone(880, 100, sr), make_tone(1175, 140, sr)]))
+    # The whole fanfare, gaps included, is one buffer: a single play() call
+    # replaces four blocking Beeps and their sleep()s.
+    parts = []
+    for f, d in WIN_TONES:
+      parts += [make_tone(f, d, sr), silence(WIN_GAP_MS, sr)]
+    sfx_win = _to_sound(np.concatenate(parts[:-1]))
+  except Exception:
+    sfx_correct = sfx_win = None
+
+
+# Blocking winsound cues, run on HostWindow's sound worker thread.
+# They return False on failure so the worker can hand a bell back to Tk.
+def _winsound_correct():
+  try:
+    winsound.Beep(880, 100)
+    winsound.Beep(1175, 140)
+    return True
+  except Exception:
+    return False
+
+
+def _winsound_win():
+  try:
+    for f, d in WIN_TONES:
+      winsound.Beep(f, d)
+      time.sleep(WIN_GAP_MS / 1000)
+    return True
+  except Exception:
+    return False
 
 
 @dataclass
 class GameState:
   prompts: list[str] = field(default_factory=lambda: [""] * 6)
-  correct: list[bool] = field(default_factory=lambda: [False] * 6)
+  # Fixed-size storage, reused for the whole session: mutate in place, don't reassign
+  correct: array.array = field(default_factory=lambda: array.array("b", [0] * 6))
   remaining_seconds: int = 60
   timer_running: bool = False
   reveal_upto: int = 0  # visible indices: 0..reveal_upto
+  # Prompts are solved strictly in order, so the first unsolved index is a counter
+  _cursor: int = field(default=0, init=False)
 
   def all_correct(self) -> bool:
-    return all(self.correct)
+    return self._cursor >= 6
 
   def current_index(self) -> int:
-    for i, ok in enumerate(self.correct):
-      if not ok:
-        return i
-    return -1
+    return self._cursor if self._cursor < 6 else -1
 
 
 class DisplayWindow(tk.Toplevel):
+  # Card styles, built once and passed to configure() as-is
+  _BORDER_SOLVED = "#22c55e"
+  _BORDER_UNSOLVED = "#2b3139"
+  _BORDER_FLASH = "#00ffaa"
+  _STYLE_HIDDEN_FRAME = {"bg": "#0d0f12", "highlightbackground": "#0d0f12"}
+  _STYLE_HIDDEN_LABEL = {"bg": "#0d0f12", "fg": "#e8e8e8"}
+  _STYLE_SOLVED_FRAME = {"bg": "#12301f", "highlightbackground": _BORDER_SOLVED}
+  _STYLE_SOLVED_LABEL = {"bg": "#12301f", "fg": "#22f07a"}
+  _STYLE_UNSOLVED_FRAME = {"bg": "#1a1e24", "highlightbackground": _BORDER_UNSOLVED}
+  _STYLE_UNSOLVED_LABEL = {"bg": "#1a1e24", "fg": "#e8e8e8"}
+  _CARD_LABEL_OPTS = {"wraplength": 260, "justify": "center", "font": ("Helvetica", 20, "bold")}
+
   def __init__(self, master, state: GameState):
     super().__init__(master)
     self.state = state
@@ -81,6 +152,7 @@ class DisplayWindow(tk.Toplevel):
       fg="#e8e8e8", bg="#0d0f12"
     )
     self.timer_label.pack(pady=(16, 8))
+    self._last_timer = (None, None)  # (text, fg) currently shown
 
     # *** NEW: Non-overlapping finale banner (initially hidden) ***
     self.win_banner = tk.Label(
@@ -93,37 +165,62 @@ class DisplayWindow(tk.Toplevel):
     grid = tk.Frame(self, bg="#0d0f12")
     grid.pack(expand=True, fill="both", padx=16, pady=16)
 
+    for c in range(3):
+      grid.grid_columnconfigure(c, weight=1)
+    for r in range(2):
+      grid.grid_rowconfigure(r, weight=1)
+
+    # Cards are created already in the hidden style, so the first refresh_view
+    # only has to configure the cards that are actually visible.
     self.cards, self.card_labels = [], []
     for i in range(6):
-      frame = tk.Frame(grid, bg="#0d0f12", highlightthickness=2, highlightbackground="#2b3139")
+      frame = tk.Frame(grid, highlightthickness=2, **self._STYLE_HIDDEN_FRAME)
       r, c = divmod(i, 3)
       frame.grid(row=r, column=c, sticky="nsew", padx=10, pady=10)
-      grid.grid_columnconfigure(c, weight=1)
-      grid.grid_rowconfigure(r, weight=1)
 
-      label = tk.Label(
-        frame, text="", wraplength=260, justify="center",
-        font=("Helvetica", 20, "bold"), fg="#e8e8e8", bg="#1a1e24"
-      )
+      label = tk.Label(frame, text="", **self._CARD_LABEL_OPTS, **self._STYLE_HIDDEN_LABEL)
       label.pack(expand=True, fill="both", padx=12, pady=12)
 
       self.cards.append(frame)
       self.card_labels.append(label)
 
+    # Last (frame style, label style, text) applied per card; None = unknown
+    hidden = (self._STYLE_HIDDEN_FRAME, self._STYLE_HIDDEN_LABEL, "")
+    self._card_state = [hidden] * 6
     self.flash_job = None
+    self._flashing = False
+    self._flash_end = 0.0
+    self._update_display_prompts()
     self.refresh_view()
 
   def set_timer(self, seconds: int, urgent: bool = False):
     seconds = max(0, int(seconds))
     m, s = divmod(seconds, 60)
-    self.timer_label.config(text=f"{m:02d}:{s:02d}", fg=("#ff5a5a" if urgent else "#e8e8e8"))
+    self._show_timer(f"{m:02d}:{s:02d}", "#ff5a5a" if urgent else "#e8e8e8")
+
+  def show_time_up(self):
+    self._show_timer("TIME!", "#ff5a5a")
+
+  def _show_timer(self, text, fg):
+    # Skip the Tcl round-trip when nothing visible changes
+    if (text, fg) == self._last_timer:
+      return
+    self.timer_label.config(text=text, fg=fg)
+    self._last_timer = (text, fg)
 
   def set_prompts(self, prompts):
-    self.state.prompts = prompts[:]
+    # Written into the existing list; a no-op when handed state.prompts itself
+    if prompts is not self.state.prompts:
+      self.state.prompts[:] = prompts
+    self._update_display_prompts()
     self.refresh_view()
 
+  def _update_display_prompts(self):
+    # Card text only changes with the prompts, so strip/default it once here
+    self._display_prompts = [p.strip() or f"Prompt {i+1}" for i, p in enumerate(self.state.prompts)]
+
   def set_correct(self, index, value):
-    self.state.correct[index] = bool(value)
+    self.state.correct[index] = 1 if value else 0
     self.refresh_view()
 
   def set_reveal_upto(self, upto_idx: int):
@@ -131,25 +228,25 @@ class DisplayWindow(tk.Toplevel):
     self.refresh_view()
 
   def refresh_view(self):
-    prompts = self.state.prompts
-    # Hide everything first
-    for i in range(6):
-      self.cards[i].configure(bg="#0d0f12", highlightbackground="#0d0f12")
-      self.card_labels[i].configure(text="", bg="#0d0f12")
-
+    prompts = self._display_prompts
     visible_last = self.state.reveal_upto
-    for i in range(visible_last + 1):
-      frame = self.cards[i]
-      label = self.card_labels[i]
-      solved = self.state.correct[i]
-      text = prompts[i].strip() or f"Prompt {i+1}"
-
-      if solved:
-        frame.configure(bg="#12301f", highlightbackground="#22c55e")
-        label.configure(text=f"✓ {text}", bg="#12301f", fg="#22f07a")
+    for i in range(6):
+      if i > visible_last:
+        # Hidden card: blends into the background
+        target = (self._STYLE_HIDDEN_FRAME, self._STYLE_HIDDEN_LABEL, "")
       else:
-        frame.configure(bg="#1a1e24", highlightbackground="#2b3139")
-        label.configure(text=text, bg="#1a1e24", fg="#e8e8e8")
+        text = prompts[i]
+        if self.state.correct[i]:
+          target = (self._STYLE_SOLVED_FRAME, self._STYLE_SOLVED_LABEL, f"✓ {text}")
+        else:
+          target = (self._STYLE_UNSOLVED_FRAME, self._STYLE_UNSOLVED_LABEL, text)
+      # Only touch Tk when the card actually changes
+      if target == self._card_state[i]:
+        continue
+      frame_style, label_style, text = target
+      self.cards[i].configure(**frame_style)
+      self.card_labels[i].configure(text=text, **label_style)
+      self._card_state[i] = target
 
   # ---------- Finale (banner below timer, no overlay) ----------
   def show_all_six(self):
@@ -160,6 +257,7 @@ class DisplayWindow(tk.Toplevel):
     except Exception:
       pass
     self.win_banner.pack(after=self.timer_label, pady=(0, 8))
+    self._flash_end = time.monotonic() + 4.0
     self._start_flash()
     self.after(4000, self.hide_win_banner)
 
@@ -171,27 +269,41 @@ class DisplayWindow(tk.Toplevel):
     self._stop_flash()
 
   def _start_flash(self):
-    if self.flash_job:
+    if self._flashing:
       return
+    self._flashing = True
     self._flash_tick()
 
   def _flash_tick(self):
+    # A tick already queued (after/after_idle) when the flash stopped is stale
+    if not self._flashing or not self.winfo_exists():
+      return
+    if time.monotonic() >= self._flash_end:
+      return self._stop_flash()
     # Pulse the borders of visible cards
     for i in range(self.state.reveal_upto + 1):
       frame = self.cards[i]
       current = frame.cget("highlightbackground")
-      frame.configure(highlightbackground="#00ffaa" if current != "#00ffaa" else "#22c55e")
-    self.flash_job = self.after(180, self._flash_tick)
+      frame.configure(
+        highlightbackground=self._BORDER_FLASH if current != self._BORDER_FLASH else self._BORDER_SOLVED
+      )
+      self._card_state[i] = None  # border changed behind refresh_view's back
+    # Re-arm via after_idle so a slow tick can't let flashes pile up in Tk's queue
+    self.flash_job = self.after(180, lambda: self.after_idle(self._flash_tick))
 
   def _stop_flash(self):
     if self.flash_job:
       self.after_cancel(self.flash_job)
       self.flash_job = None
+    if not self._flashing:
+      return  # borders already restored
+    self._flashing = False
     for i in range(self.state.reveal_upto + 1):
       frame = self.cards[i]
       # Keep green outline for solved, neutral for the current/others
       solved = self.state.correct[i]
-      frame.configure(highlightbackground="#22c55e" if solved else "#2b3139")
+      frame.configure(highlightbackground=self._BORDER_SOLVED if solved else self._BORDER_UNSOLVED)
+      self._card_state[i] = None
 
 
 class HostWindow(ttk.Frame):
@@ -215,6 +327,7 @@ class HostWindow(ttk.Frame):
     # Prompts + Correct buttons
     self.entry_vars = [tk.StringVar() for _ in range(6)]
     self.correct_btns = []
+    self._enabled_btn: int | None = None  # index of the one enabled Correct button
     grid = ttk.Frame(self)
     grid.pack(fill="both", expand=True, padx=12, pady=6)
 
@@ -224,6 +337,7 @@ class HostWindow(ttk.Frame):
       ttk.Label(row, text=f"{i+1}.").pack(side="left", padx=(0, 8))
       ttk.Entry(row, textvariable=self.entry_vars[i]).pack(side="left", fill="x", expand=True)
       btn = ttk.Button(row, text="Correct", command=lambda idx=i: self.mark_correct(idx))
+      btn.state(["disabled"])  # _refresh_buttons enables the active one
       btn.pack(side="left", padx=8)
       self.correct_btns.append(btn)
 
@@ -237,16 +351,41 @@ class HostWindow(ttk.Frame):
     self.status_var = tk.StringVar(value="Ready.")
     ttk.Label(self, textvariable=self.status_var, anchor="w").pack(fill="x", padx=12, pady=(0, 10))
 
+    # Pick the sound backend once. Pre-rendered Sounds are non-blocking and play
+    # straight from the Tk thread; only the blocking winsound fallback gets a
+    # (single, long-lived) worker; otherwise ring the Tk bell.
+    if sfx_correct is not None:
+      self._play_correct = lambda: self.after(0, sfx_correct.play)
+      self._play_win = lambda: self.after(0, sfx_win.play)
+    elif HAS_WINSOUND:
+      self._sfx_q = queue.Queue()
+      threading.Thread(target=self._sfx_worker, daemon=True).start()
+      self._play_correct = lambda: self._sfx_q.put((_winsound_correct, self._bell_correct))
+      self._play_win = lambda: self._sfx_q.put((_winsound_win, self._bell_win))
+    else:
+      self._play_correct = self._bell_correct
+      self._play_win = self._bell_win
+
     # Init
     self._tick_job = None
-    self.send_to_display()
+    self._deadline: float | None = None  # time.monotonic() when the running timer hits zero
+    self._send_job = None
+    self._do_send_to_display()
     self.display.set_timer(self.state.remaining_seconds)
     self._refresh_buttons()
 
   # --- Host actions ---
   def send_to_display(self):
-    prompts = [v.get() for v in self.entry_vars]
-    self.state.prompts = prompts
+    # Debounced: a burst of calls collapses into one repaint 50 ms after the last
+    if self._send_job:
+      self.after_cancel(self._send_job)
+    self._send_job = self.after(50, self._do_send_to_display)
+
+  def _do_send_to_display(self):
+    self._send_job = None
+    prompts = self.state.prompts
+    for i, v in enumerate(self.entry_vars):
+      prompts[i] = v.get()
     cur = self.state.current_index()
     self.state.reveal_upto = (cur if cur >= 0 else 5)
     self.display.set_prompts(prompts)
@@ -260,7 +399,9 @@ class HostWindow(ttk.Frame):
     self.send_to_display()
 
   def unmark_all(self):
-    self.state.correct = [False] * 6
+    for i in range(6):
+      self.state.correct[i] = 0
+    self.state._cursor = 0
     self.state.reveal_upto = 0
     self.display.hide_win_banner()
     self.display.refresh_view()
@@ -276,12 +417,13 @@ class HostWindow(ttk.Frame):
       return
 
     if not self.state.correct[idx]:
-      self.state.correct[idx] = True
+      self.state.correct[idx] = 1
+      self.state._cursor = idx + 1
       if idx < 5:
         self.state.reveal_upto = max(self.state.reveal_upto, idx + 1)
       self.display.set_correct(idx, True)
       self.display.set_reveal_upto(self.state.reveal_upto)
-      threading.Thread(target=play_correct_sound, daemon=True).start()
+      self._play_correct()
 
       if self.state.all_correct():
         self._do_all_six()
@@ -295,11 +437,16 @@ class HostWindow(ttk.Frame):
       return
     self.state.remaining_seconds = max(0, int(self.seconds_var.get()))
     self.state.timer_running = True
+    self._deadline = time.monotonic() + self.state.remaining_seconds
     self.display.set_timer(self.state.remaining_seconds)
     self._tick()
 
   def stop_timer(self):
     self.state.timer_running = False
+    # Cancel the pending tick outright rather than letting it wake up to see the flag
+    if self._tick_job:
+      self.after_cancel(self._tick_job)
+      self._tick_job = None
 
   def reset_timer(self):
     self.stop_timer()
@@ -310,36 +457,63 @@ class HostWindow(ttk.Frame):
   def _tick(self):
     if not self.state.timer_running:
       return
-    self.state.remaining_seconds -= 1
+    # Count down against a monotonic deadline; after() only guarantees "not less
+    # than" its delay, so decrementing once per call would drift behind wall-clock.
+    rem = self._deadline - time.monotonic()
+    self.state.remaining_seconds = max(0, math.ceil(rem))
     self.display.set_timer(self.state.remaining_seconds, urgent=self.state.remaining_seconds <= 10)
-    if self.state.remaining_seconds <= 0:
+    if rem <= 0:
       self.state.timer_running = False
-      self.display.timer_label.config(text="TIME!", fg="#ff5a5a")
+      self._tick_job = None
+      self.display.show_time_up()
       self.status_var.set("Time's up!")
       return
-    self._tick_job = self.after(1000, self._tick)
+    # Wake just after the next whole-second boundary; in the last 10 s also poll
+    # every 250 ms so sub-second urgency effects have a hook (set_timer skips
+    # the repaint when the shown second hasn't changed).
+    delay_ms = max(1, math.ceil((rem - math.floor(rem)) * 1000))
+    if rem <= 10:
+      delay_ms = min(delay_ms, 250)
+    self._tick_job = self.after(delay_ms, self._tick)
 
   # --- Finale ---
   def _do_all_six(self):
     self.stop_timer()
     self._refresh_buttons()
     self.display.show_all_six()
-    threading.Thread(target=play_win_sound, daemon=True).start()
+    self._play_win()
     self.status_var.set("ALL SIX! Round complete.")
 
   # --- Helpers ---
+  def _bell_correct(self):
+    self.bell()
+
+  def _bell_win(self):
+    for k in range(3):
+      self.after(150 * k, self.bell)
+
+  def _sfx_worker(self):
+    while True:
+      play, fallback = self._sfx_q.get()
+      if not play():
+        # Never ring Tk from this thread; after() is marshalled to the Tk thread
+        self.after(0, fallback)
+
   def _refresh_buttons(self):
+    # At most one button is enabled, so only the old and new active ones change
     cur = self.state.current_index()
-    for i, btn in enumerate(self.correct_btns):
-      if cur == -1:
-        btn.state(["disabled"])
-      elif i == cur:
-        btn.state(["!disabled"])
-      else:
-        btn.state(["disabled"])
+    target = cur if cur != -1 else None
+    if target == self._enabled_btn:
+      return
+    if self._enabled_btn is not None:
+      self.correct_btns[self._enabled_btn].state(["disabled"])
+    if target is not None:
+      self.correct_btns[target].state(["!disabled"])
+    self._enabled_btn = target
 
 
 def main():
+  init_sfx()
   root = tk.Tk()
   root.withdraw()
   state = GameState()